@@ -1,5 +1,6 @@
 import logging
 import hashlib
+from datetime import datetime
 from typing import Optional, Dict
 from fastapi import APIRouter, Depends, HTTPException, Form
 from fastapi.security import OAuth2PasswordBearer
@@ -94,6 +95,8 @@ class AuthService:
 
                 for link in links:
                     link.user_id = user_id
+                    link.updated_at = datetime.utcnow()
+                    link.version += 1
 
                 await session.commit()
                 logger.info(f"Updated user_id for {len(links)} links")
@@ -31,6 +31,8 @@ class LinkOrm(Model):
     user_id: Mapped[Optional[int]] = mapped_column(nullable=True)
     click_count: Mapped[int] = mapped_column(default=0)
     last_used_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+    version: Mapped[int] = mapped_column(default=1)
 
 
 async def create_tables():
@@ -0,0 +1,86 @@
+import os
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+from fastapi import Request, Response
+from database import LinkOrm
+
+HTTP_CACHE_MAX_AGE = int(os.getenv("HTTP_CACHE_MAX_AGE", "5"))
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+def make_etag(link_id: int, version: int, updated_at: datetime) -> str:
+    """
+    updated_at входит в тег, потому что id и version начинаются заново после пересоздания ссылки.
+    """
+    return f'W/"{link_id}-{version}-{int(_as_utc(updated_at).timestamp() * 1_000_000)}"'
+
+def cache_headers(etag: str, last_modified: Optional[datetime], max_age: int = HTTP_CACHE_MAX_AGE) -> dict:
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={max_age}",
+    }
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified).replace(microsecond=0), usegmt=True)
+    return headers
+
+def reliable_last_modified(updated_at: datetime, now: datetime) -> Optional[datetime]:
+    """
+    Last-Modified с точностью до секунды не отличит изменение в ту же секунду,
+    поэтому для записей, измененных меньше секунды назад, он не используется.
+    """
+    if _as_utc(now) - _as_utc(updated_at) < timedelta(seconds=1):
+        return None
+    return updated_at
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Слабое сравнение ETag из If-None-Match (RFC 9110, 13.1.2).
+    """
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+def not_modified_since(if_modified_since: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return _as_utc(last_modified).replace(microsecond=0) <= _as_utc(since)
+
+def is_not_modified(
+    if_none_match: Optional[str],
+    if_modified_since: Optional[str],
+    etag: str,
+    last_modified: Optional[datetime],
+) -> bool:
+    """
+    Проверка условного запроса: If-None-Match имеет приоритет над If-Modified-Since.
+    """
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+    if if_modified_since is not None and last_modified is not None:
+        return not_modified_since(if_modified_since, last_modified)
+    return False
+
+def conditional_response(request: Request, response: Response, link: LinkOrm) -> Optional[Response]:
+    """
+    Возвращает 304, если клиентская копия актуальна, иначе добавляет заголовки кэширования в ответ.
+    """
+    etag = make_etag(link.id, link.version, link.updated_at)
+    last_modified = reliable_last_modified(link.updated_at, datetime.utcnow())
+    headers = cache_headers(etag, last_modified)
+
+    if is_not_modified(
+        request.headers.get("if-none-match"),
+        request.headers.get("if-modified-since"),
+        etag,
+        last_modified,
+    ):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return None
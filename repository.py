@@ -94,7 +94,7 @@ class LinkRepository:
 
 
     @classmethod
-    async def find_by_original_url(cls, original_url: str) -> Optional[SLinkResponse]:
+    async def find_by_original_url(cls, original_url: str) -> Optional[LinkOrm]:
         """
         Поиск по оригинальному URL.
         """
@@ -102,7 +102,7 @@ class LinkRepository:
             normalized_url = normalize_url(original_url)
             logger.debug(f"Normalized URL: {normalized_url}")
 
-            query = select(LinkOrm).where(LinkOrm.original_url == normalized_url)
+            query = select(LinkOrm).where(LinkOrm.original_url == normalized_url).order_by(LinkOrm.id)
             result = await session.execute(query)
             link = result.scalars().first()
 
@@ -111,19 +111,7 @@ class LinkRepository:
             else:
                 logger.debug("Link not found")
 
-            if not link:
-                return None
-
-            return SLinkResponse(
-                id=link.id,
-                original_url=link.original_url,
-                short_code=link.short_code,
-                created_at=link.created_at,
-                expires_at=link.expires_at,
-                user_id=link.user_id,
-                click_count=link.click_count,
-                short_url=f"http://127.0.0.1:8000/links/{link.short_code}",
-            )
+            return link
 
 
     @classmethod
@@ -150,7 +138,11 @@ class LinkRepository:
 
                 query = update(LinkOrm).where(
                     (LinkOrm.short_code == short_code) & (LinkOrm.user_id == user_id)
-                ).values(original_url=normalized_url)
+                ).values(
+                    original_url=normalized_url,
+                    updated_at=datetime.utcnow(),
+                    version=LinkOrm.version + 1,
+                )
                 await session.execute(query)
                 await session.commit()
 
@@ -172,7 +164,11 @@ class LinkRepository:
         Счетчик переходов по ссылке.
         """
         async with new_session() as session:
-            query = update(LinkOrm).where(LinkOrm.id == link_id).values(click_count=LinkOrm.click_count + 1)
+            query = update(LinkOrm).where(LinkOrm.id == link_id).values(
+                click_count=LinkOrm.click_count + 1,
+                updated_at=datetime.utcnow(),
+                version=LinkOrm.version + 1,
+            )
             await session.execute(query)
             await session.commit()
 
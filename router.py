@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, Form, Request
+from fastapi import APIRouter, Depends, HTTPException, Form, Request, Response
 from fastapi.responses import RedirectResponse
 from repository import LinkRepository
+from http_cache import conditional_response
 from schemas import SLinkAdd, SLinkResponse, UserResponse, SLinkStatsResponse
 from auth import get_current_user
 from typing import Optional
@@ -18,6 +19,7 @@ router = APIRouter(
 async def search_link_by_original_url(
     original_url: str,
     request: Request,
+    response: Response,
 ):
     """
     Поиск ссылки по оригинальному URL.
@@ -26,8 +28,20 @@ async def search_link_by_original_url(
     if not link:
         raise HTTPException(status_code=404, detail="Ссылка не найдена")
 
-    link.short_url = f"{request.base_url}links/{link.short_code}"
-    return link
+    not_modified = conditional_response(request, response, link)
+    if not_modified is not None:
+        return not_modified
+
+    return SLinkResponse(
+        id=link.id,
+        original_url=link.original_url,
+        short_code=link.short_code,
+        created_at=link.created_at,
+        expires_at=link.expires_at,
+        user_id=link.user_id,
+        click_count=link.click_count,
+        short_url=f"{request.base_url}links/{link.short_code}",
+    )
 
 
 @router.post("/shorten", response_model=SLinkResponse)
@@ -133,7 +147,11 @@ async def update_link(
 
 
 @router.get("/{short_code}/stats", response_model=SLinkStatsResponse)
-async def link_stats(short_code: str) -> SLinkStatsResponse:
+async def link_stats(
+    short_code: str,
+    request: Request,
+    response: Response,
+) -> SLinkStatsResponse:
     """
     Статистика по короткой ссылке.
     """
@@ -141,6 +159,10 @@ async def link_stats(short_code: str) -> SLinkStatsResponse:
     if not link:
         raise HTTPException(status_code=404, detail="Ссылка не найдена")
 
+    not_modified = conditional_response(request, response, link)
+    if not_modified is not None:
+        return not_modified
+
     return SLinkStatsResponse(
         original_url=link.original_url,
         created_at=link.created_at,